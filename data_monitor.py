@@ -1,12 +1,61 @@
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
-from multiprocessing import Process, Queue, TimeoutError
-from multiprocessing.connection import Connection
-from numpy import ndim, ndarray
-from queue import Empty
+import matplotlib
+import time
+import warnings
+from collections import deque
+from contextlib import nullcontext
+from multiprocessing import Process, Queue, RawValue, resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from numpy import array_equal, asarray, concatenate, empty, float64, ndim, ndarray, uint64
+from queue import Empty, SimpleQueue
+from threading import Lock, Thread, Timer
 
 
-plt.style.use('fivethirtyeight')
+BACKENDS = ('QtAgg', 'TkAgg', 'Agg')
+""" matplotlib backends which are tried (in this order) by the DataMonitor subprocess """
+
+RC_PARAMS = {
+    'path.simplify': True,  # merge line segments of sub-pixel length before rendering
+    'path.simplify_threshold': 1.,
+    'agg.path.chunksize': 10000,  # render long lines in chunks
+}
+""" matplotlib rcParams of the DataMonitor subprocess, which speed up the rendering of long time-series """
+
+
+def use_backend(backends: (str, tuple) = BACKENDS):
+    """ Selects the first available matplotlib backend
+
+    :param backends: backend name or tuple of backend names which are tried in the specified order
+                     (the non-interactive 'Agg' backend is available on headless systems)
+    :return: name of the selected backend (or None if none of the backends is available)
+    """
+    import matplotlib.pyplot as plt
+
+    if isinstance(backends, str):
+        backends = (backends, )
+
+    for backend in backends:
+        try:
+            plt.switch_backend(backend)  # loads the backend (unlike matplotlib.use before the first figure)
+            return backend
+        except ImportError:
+            pass
+
+    return None
+
+
+def is_interactive_backend(backend: str):
+    """ Checks whether the matplotlib backend is interactive (i.e., requires to run in the main thread)
+
+    :param backend: backend name
+    :return: True for the builtin interactive backends (such as 'QtAgg' or 'TkAgg'), False otherwise
+    """
+    try:
+        from matplotlib.backends import BackendFilter, backend_registry
+        interactive_backends = backend_registry.list_builtin(BackendFilter.INTERACTIVE)
+    except ImportError:  # matplotlib < 3.9
+        from matplotlib.rcsetup import interactive_bk as interactive_backends
+
+    return backend.lower() in [b.lower() for b in interactive_backends]
 
 
 def default_fig(**kwargs):
@@ -14,29 +63,83 @@ def default_fig(**kwargs):
 
     :return: matplotlib tuple of (figure, axes) of the current plt environment """
 
+    import matplotlib.pyplot as plt
+
     fig = plt.figure(**kwargs)
-    ax = plt.gca()
+    ax = fig.add_subplot()
 
     return fig, ax
 
 
 def default_ax_plot(ax, data, channels: (list, tuple) = ()):
-    """ Plots the data
+    """ Plots the data and returns the generated line artists
 
     :param data: the data to be plotted, assumed to be in the format of (x, *y)
     :param channels: list or tuple of channel information for each data-row in y
+    :return: list of matplotlib Line2D artists, one for each data-row in y
 
     - If `channels` information have been specified in the object construction (i.e., a list of dicts),
-      each data-channel (`y[i]`) is plotted (`plt.plot`) with keywords `**self.channel[i]`.
+      each data-channel (`y[i]`) is plotted (`ax.plot`) with keywords `**self.channel[i]`.
     """
     x, *y = data
 
     if ndim(y) == 1:
         y = [y]
 
-    for i in range(len(y)):
-        c = {} if channels in ((), {}, None) else channels[i]
-        ax.plot(x, y[i], **c)
+    if channels in ((), {}, None):
+        channels = [{}] * len(y)
+
+    lines = []
+    for y_i, c in zip(y, channels):
+        lines.extend(ax.plot(x, y_i, **c))
+
+    return lines
+
+
+def default_ax_update(lines, data, points_per_pixel: (int, None) = 4):
+    """ Updates the line artists (generated by `default_ax_plot`) with new data
+
+    :param lines: list of matplotlib Line2D artists, one for each data-row in y
+    :param data: the data to be plotted, assumed to be in the format of (x, *y)
+    :param points_per_pixel: maximal number of data points per pixel of the axes width,
+                             denser data is downsampled (with a constant stride) before it is rendered
+                             (If None, all data points are passed to the line artists).
+                             The downsampling is anchored at the most recent data point, which is always rendered.
+    """
+    x, *y = data
+    n = len(x)
+
+    # the x-data is shared by all lines, it is downsampled once per stride
+    x_strided = {}
+    for line, y_i in zip(lines, y):
+        stride = 1
+        if points_per_pixel is not None:
+            stride = max(1, n // max(1, int(points_per_pixel * line.axes.bbox.width)))
+
+        start = (n - 1) % stride
+        if stride not in x_strided:
+            x_strided[stride] = x[start::stride]
+
+        x_i = x_strided[stride]
+        if _is_unchanged(line.get_xdata(), x_i):
+            line.set_ydata(y_i[start::stride])  # unchanged x-data (e.g., a fixed x-axis) is not re-processed
+        else:
+            line.set_data(x_i, y_i[start::stride])
+
+
+def _is_unchanged(x_line, x):
+    """ Checks whether the x-data of a line artist equals the new x-data
+
+        The cheap checks (length, first and last data point) fail for scrolling data,
+        before all data points are compared.
+    """
+    if len(x_line) != len(x):
+        return False
+
+    if len(x) and (x_line[0] != x[0] or x_line[-1] != x[-1]):
+        return False
+
+    return array_equal(x_line, x)
 
 
 def default_legend(ax, channels=None):
@@ -49,29 +152,329 @@ def default_legend(ax, channels=None):
             [ax_i.legend() for ax_i in ax]
 
 
+class SharedDoubleBuffer(object):
+    """ Single-producer/single-consumer double buffer of (x, *y) data arrays in shared memory
+
+        The producer copies each data array into the currently inactive buffer and increments
+        the shared sequence counter, the consumer reads the most recently written buffer.
+        Data arrays with more than `capacity` data points are truncated to their last `capacity` data points.
+
+        All state is held in the shared memory block, such that the buffer can be pickled
+        (e.g. put into a multiprocessing queue) and is re-attached by the receiving process.
+    """
+
+    def __init__(self, n_rows: int, capacity: int):
+        """ Constructs a SharedDoubleBuffer instance
+
+        :param n_rows: number of data rows (x, *y) of the transferred data arrays
+        :param capacity: maximal number of data points (columns) of the transferred data arrays
+        """
+        self.shape = (n_rows, capacity)
+
+        # shared memory layout: sequence counter and data-point counts of both buffers, followed by both buffers
+        size = 3 * uint64().nbytes + 2 * n_rows * capacity * float64().nbytes
+        self._shm = SharedMemory(create=True, size=size)
+        self._read_seq = 0
+        self._owner = True
+
+        self._seq = None
+        self._counts = None
+        self._buffers = None
+        self._map_buffers()
+
+    @property
+    def seq(self) -> int:
+        """ Number of data arrays published so far """
+        return int(self._seq[0])
+
+    def mark_read(self, seq: int):
+        """ Marks the data arrays published up to the sequence number `seq` as read (see `seq`) """
+        self._read_seq = seq
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_seq'] = None
+        state['_counts'] = None
+        state['_buffers'] = None
+        state['_owner'] = False
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._map_buffers()
+
+    def _map_buffers(self):
+        header = ndarray((3, ), dtype=uint64, buffer=self._shm.buf)
+        self._seq, self._counts = header[:1], header[1:]
+        self._buffers = ndarray((2, *self.shape), dtype=float64, buffer=self._shm.buf, offset=header.nbytes)
+
+    def put(self, value):
+        """ Copies the (n_rows, n) data array into the inactive buffer and publishes it to the consumer """
+        value = asarray(value, dtype=float64)
+
+        if ndim(value) != 2 or value.shape[0] != self.shape[0]:
+            raise ValueError(f'Expected data of shape ({self.shape[0]}, n) (x, *y), got {value.shape}.')
+
+        n = min(value.shape[1], self.shape[1])
+        seq = int(self._seq[0]) + 1
+        index = seq % 2
+
+        self._buffers[index, :, :n] = value[:, value.shape[1] - n:]
+        self._counts[index] = n
+        self._seq[0] = seq
+
+    def get(self):
+        """ Returns a copy of the most recently published data array (or None if no new data has been published) """
+        seq = int(self._seq[0])
+        if seq == self._read_seq:
+            return None
+
+        while True:
+            index = seq % 2
+            data = self._buffers[index, :, :self._counts[index]].copy()
+
+            # the producer might have overwritten the buffer while copying (retry with the newer buffer)
+            published_seq = int(self._seq[0])
+            if published_seq == seq:
+                break
+
+            seq = published_seq
+
+        self._read_seq = seq
+        return data
+
+    def close(self):
+        """ Releases the shared memory (which is unlinked by the creating process) """
+        self._seq = None
+        self._counts = None
+        self._buffers = None
+        self._shm.close()
+
+        if self._owner:
+            self._shm.unlink()
+
+
+class SharedRingBuffer(object):
+    """ Single-producer/single-consumer ring buffer of (x, *y) data samples in shared memory
+
+        The producer copies each sample into the next slot of the ring and increments the shared
+        write-counter (a single store, no locking), the consumer reads all samples written since its last read.
+        If the consumer can not keep up, the oldest unread samples are overwritten
+        (only the `capacity` most recent samples are kept).
+
+        As the SharedDoubleBuffer, the ring buffer can be pickled and is re-attached by the receiving process.
+    """
+
+    def __init__(self, n_rows: int, capacity: int):
+        """ Constructs a SharedRingBuffer instance
+
+        :param n_rows: number of data rows (x, *y) of each sample
+        :param capacity: number of samples held by the ring buffer
+        """
+        self.shape = (capacity, n_rows)
+
+        # shared memory layout: number of written samples, followed by the ring
+        self._shm = SharedMemory(create=True, size=uint64().nbytes + capacity * n_rows * float64().nbytes)
+        self._tail = 0  # number of read samples
+        self._owner = True
+
+        self._head = None
+        self._ring = None
+        self._map_buffers()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_head'] = None
+        state['_ring'] = None
+        state['_owner'] = False
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._map_buffers()
+
+    def _map_buffers(self):
+        self._head = ndarray((1, ), dtype=uint64, buffer=self._shm.buf)
+        self._ring = ndarray(self.shape, dtype=float64, buffer=self._shm.buf, offset=self._head.nbytes)
+
+    def put(self, sample):
+        """ Copies the (x, *y) sample into the ring buffer and publishes it to the consumer """
+        head = int(self._head[0])
+        self._ring[head % self.shape[0]] = sample
+        self._head[0] = head + 1
+
+    def get(self):
+        """ Returns a (n_rows, n_samples) array of the samples published since the last call
+            (or None if no new samples have been published)
+
+            All pending samples are read at once, as (at most two) contiguous blocks of the ring buffer.
+        """
+        head = int(self._head[0])
+        tail = max(self._tail, head - self.shape[0])
+        if head == tail:
+            return None
+
+        start = tail % self.shape[0]
+        stop = start + head - tail
+        if stop <= self.shape[0]:
+            samples = self._ring[start:stop].copy()
+        else:
+            samples = concatenate((self._ring[start:], self._ring[:stop - self.shape[0]]))
+
+        # samples which have been overwritten by the producer while copying are discarded
+        # (including the slot of the sample which might currently be written)
+        overwritten = int(self._head[0]) + 1 - self.shape[0] - tail
+        if overwritten > 0:
+            samples = samples[overwritten:]
+
+        self._tail = head
+        return samples.T if len(samples) else None
+
+    def close(self):
+        """ Releases the shared memory (which is unlinked by the creating process) """
+        self._head = None
+        self._ring = None
+        self._shm.close()
+
+        if self._owner:
+            self._shm.unlink()
+
+
+class LocalBuffer(object):
+    """ In-process counterpart of the SharedDoubleBuffer for a DataMonitor running in a thread
+
+        Only a reference to the most recently published data array is kept (no copies are made),
+        the data arrays must therefore not be modified after they have been published.
+    """
+
+    def __init__(self):
+        """ Constructs a LocalBuffer instance """
+        self._data = deque(maxlen=1)
+
+    def put(self, value):
+        """ Publishes the data array to the consumer (replacing a not yet consumed data array) """
+        self._data.append(value)
+
+    def get(self):
+        """ Returns the most recently published data array (or None if no new data has been published) """
+        try:
+            return self._data.pop()
+        except IndexError:
+            return None
+
+    def close(self):
+        """ Discards a not yet consumed data array """
+        self._data.clear()
+
+
+class DataEventSource(object):
+    """ Event source of the matplotlib function animation which only fires if new data has been received
+
+        A timer of the figure canvas polls for new data every `interval` milliseconds, the animation
+        update (and the re-rendering of the line artists) is only triggered if the poll succeeds.
+    """
+
+    def __init__(self, timer, poll: callable):
+        """ Constructs a DataEventSource instance
+
+        :param timer: timer of the figure canvas (see `FigureCanvasBase.new_timer`)
+        :param poll: callable without arguments which returns True if new data has been received
+        """
+        self.timer = timer
+        self.poll = poll
+        self.callbacks = []
+        self.timer.add_callback(self._on_timer)
+
+    @property
+    def interval(self):
+        """ Polling interval in milliseconds """
+        return self.timer.interval
+
+    @interval.setter
+    def interval(self, value):
+        self.timer.interval = value
+
+    def add_callback(self, func, *args, **kwargs):
+        """ Registers `func(*args, **kwargs)` to be called on new data """
+        self.callbacks.append((func, args, kwargs))
+
+    def remove_callback(self, func, *args, **kwargs):
+        """ Removes `func` from the callbacks (all registrations of `func`, if no args are specified) """
+        self.callbacks = [(f, a, k) for f, a, k in self.callbacks
+                          if f != func or ((args or kwargs) and (a, k) != (args, kwargs))]
+
+    def start(self):
+        """ Starts polling for new data """
+        self.timer.start()
+
+    def stop(self):
+        """ Stops polling for new data """
+        self.timer.stop()
+
+    def _on_timer(self):
+        if self.poll():
+            for func, args, kwargs in list(self.callbacks):
+                func(*args, **kwargs)
+
+
 class DataMonitor(object):
     """ Data Monitoring of externally manipulated data
 
         For custom configuration consider passing
-        (i) `make_fig` and
-        (ii) `ax_plot`
+        (i) `make_fig`,
+        (ii) `ax_plot` and
+        (iii) `ax_update`
         callables to the DataMonitor during construction to
-        (i) generate a custom (fig, axes) matplotlib environment and to
-        (ii) specify, how the data is plotted.
+        (i) generate a custom (fig, axes) matplotlib environment,
+        (ii) specify, how the data is plotted (i.e., which line artists are generated) and
+        (iii) specify, how the line artists are updated with new data.
+
+        The line artists are generated only once and are then updated in each animation step,
+        which allows for a fast (blitted) rendering of the monitor.
 
         The data-monitor runs matplotlib in an extra multiprocessing.Process.
-        For a clean subprocess handling it is recommended to use DataMonitor in the with environment:
+        For a clean subprocess handling it is recommended to use DataMonitor in the with environment
+        (or to call `close` explicitly, which terminates the subprocess):
 
         > with DataMonitor(channels=..., ...) as dm:
         >     while True:
         >         dm.data = <update data from external source>
         >         <do something else>
+
+        Alternatively, single data samples of the form (x, *y) can be appended to the monitored data
+        (which is then accumulated in the subprocess), instead of resending the entire data in each update:
+
+        > with DataMonitor(channels=..., ...) as dm:
+        >     while True:
+        >         dm.append(<sample from external source>)
+        >         <do something else>
+
+        The shared memory buffers are allocated with the shape of the first data (or the first sample):
+        Data which can be converted to a float64 array of shape (rows, n) is copied via shared memory
+        (restricted to the `max_points` most recent data points, a changed number of rows allocates a new buffer),
+        any other data (e.g. rows of different lengths or non-numeric data) is pickled and passed via a
+        multiprocessing queue (which is slower). Appended samples must be numeric and have the number of rows
+        of the first appended sample.
+
+        With `use_thread=True`, matplotlib runs in a background thread of the current process instead,
+        which avoids copying the data between processes. The thread uses the matplotlib backend of the
+        current process, which must be non-interactive (interactive backends require to run in the main thread),
+        and leaves its global matplotlib state (backend, rcParams and style) unchanged.
+        Instead of showing a window, each frame with new data is rendered on the figure canvas,
+        the most recently rendered frame is available as RGBA image via the `frame` property:
+
+        > with DataMonitor(channels=..., use_thread=True, ...) as dm:
+        >     while True:
+        >         dm.data = <update data from external source>
+        >         image = dm.frame
     """
 
-    def __init__(self, data: (list, ndarray) = None, channels: (None, list) = None, clear_axes=True, update_rate=1.,
+    def __init__(self, data: (list, ndarray) = None, channels: (None, list) = None, clear_axes=None, update_rate=1.,
                  make_fig: callable = default_fig, make_fig_kwargs: (dict, tuple) = (),
-                 ax_plot: callable = default_ax_plot, ax_kwargs: (dict, tuple) = (),
-                 legend=default_legend,
+                 ax_plot: callable = default_ax_plot, ax_update: callable = default_ax_update,
+                 ax_kwargs: (dict, tuple) = (), legend=default_legend, blit=True, max_points: int = 10000, max_fps=None,
+                 backend: (str, tuple, None) = BACKENDS, style: (str, None) = 'fast', use_thread=False,
+                 show_fps=False,
                  ):
         """ Constructs a DataMonitor instance
 
@@ -82,28 +485,76 @@ class DataMonitor(object):
                          If the channels argument is a list of dicts, the dict corresponding to each data-channel will
                          be forwarded to ax.plot method as kwargs.
                          For custom use consider overriding the DataMonitor plot method.
-        :param clear_axes: Boolean controlling whether plt.cla() clears the axes in each animation update.
-        :param update_rate: update rate of matplotlib animation in milliseconds
+        :param clear_axes: Deprecated, Boolean controlling whether plt.cla() clears the axes in each animation update.
+                           Only used if `ax_plot` does not return the generated line artists (which are updated
+                           via `ax_update` otherwise), defaults to True in this case.
+        :param update_rate: interval (in milliseconds) at which the matplotlib animation polls for new data,
+                            the animation is only updated (and re-rendered) if new data has been received
         :param make_fig: callable which takes `make_fig_kwargs` as keyword and returns a matplotlib (figure, axes) tuple
         :param make_fig_kwargs: Dict-like kwargs to be forwarded to `make_fig`.
         :param ax_plot: callable which takes (axes, data, channels) as arguments
                         to plot the data with
                         channel meta-info
-                        on the specified axes.
+                        on the specified axes and which returns the list of generated line artists.
+                        If `ax_plot` returns None, the axes are cleared (see `clear_axes`) and re-plotted
+                        in each animation update instead (without blitting).
+                        If neither initial `data` nor the initial `channels` are specified, the figure is generated
+                        with the first data update (or appended sample), which determines the number of channels.
+        :param ax_update: callable which takes (lines, data) as arguments
+                          to update the line artists generated by `ax_plot` with new data.
         :param ax_kwargs: Dict-like kwargs (or list of dict-like kwargs for multi-axes plot) to control axes formatting:
                            (i) each **key** in `ax_kwargs` must correspond to an **attribute** of the
-                           `matplotlib.pyplot.axes` module (e.g. 'set_xlim' or 'set_ylabel'; for a single axis,
-                           `matplotlib.pyplot` module attributes can be used such as 'xlim' or 'ylabel') and
+                           `matplotlib.pyplot.axes` module (e.g. 'set_xlim' or 'set_ylabel'; the names of
+                           `matplotlib.pyplot` module attributes such as 'xlim' or 'ylabel' are mapped to the
+                           respective axes setters) and
                            (ii) the **values** must be tuples of the form (args, kwargs), specifying the
                            **arguments** and **keyword arguments** of the respective `matplotlib.pyplot` module
                            attribute (e.g. ((0, 1), {}) or (('values', ), {}).
+        :param legend: callable which takes (axes, channels) as arguments to generate the legend.
+        :param blit: Boolean controlling whether the animation only re-renders the line artists (blitting).
+                     Blitting is disabled for axes with autoscaled limits, which require a full redraw.
+        :param max_points: maximal number of data points per channel which are transferred to the function animation
+                           (or which are accumulated by appending samples), older data points are discarded
+                           (defaults to 10000).
+        :param max_fps: maximal rate (per second) at which data updates (via the `data` setter) are passed to the
+                        function animation, more frequent updates are dropped except for the most recent one, which
+                        is passed once the interval has passed (defaults to None, which disables the limit:
+                        the animation only renders the most recent data anyway, as outdated data is overwritten
+                        in the shared memory double buffer).
+                        Appended samples are not rate limited.
+        :param backend: matplotlib backend name or tuple of backend names (the first available backend is used)
+                        of the animation subprocess, defaults to `BACKENDS`.
+                        If None (or if `use_thread` is True), the matplotlib default backend is used.
+        :param style: matplotlib style sheet of the animation subprocess, defaults to 'fast'
+                      (If None, the matplotlib default style is used).
+        :param use_thread: Boolean controlling whether matplotlib runs in a background thread
+                           (with in-process data handling) instead of a subprocess, defaults to False.
+                           Requires a non-interactive matplotlib backend of the current process
+                           (a RuntimeError is raised by `start` otherwise), the rendered frames are available
+                           via the `frame` property.
+        :param show_fps: Boolean controlling whether the measured frame rate of the animation is displayed
+                         (in the lower right corner of the (first) axes), defaults to False.
+                         The measured frame rate is also available via the `fps` property (in the current process).
         """
 
         # data handling
         self._data = data
+        self.max_points = max_points
+        self._history = None
+        self._n_history = 0
+        self.max_fps = max_fps
+        self._last_put = 0.
+        self._pending = None  # most recent rate limited data update, as (value, ) tuple
+        self._pending_timer = None
+        self._put_lock = Lock()
 
         # channel handling
         self.channels = channels
+
+        if clear_axes is not None:
+            warnings.warn('`clear_axes` is deprecated, the axes are only cleared if `ax_plot` returns None',
+                          DeprecationWarning, stacklevel=2)
+
         self.clear_axes = clear_axes
 
         # matplotlib handling
@@ -118,15 +569,54 @@ class DataMonitor(object):
 
         self.make_fig = make_fig
         self.ax_plot = ax_plot
+        self.ax_update = ax_update
         self.legend = legend
+        self._lines = []
+        self._autoscale_axes = []
+        self._ax_calls = None
 
         # animation handling
         self._func_animation = None
         self.update_rate = update_rate
+        self.blit = blit
+        self._blit = blit
+        self._artists = []
+        self._new_data = None
+        self._frame = None
 
-        # multiprocess handling
+        # frame rate handling
+        self.show_fps = show_fps
+        self._fps = RawValue('d', 0.)  # measured by the function animation, shared with the current process
+        self._fps_text = None
+        self._last_frame = None
+        self.backend = backend
+        self.style = style
+
+        # multiprocess handling (the buffers are allocated with the shape of the first data)
+        self.use_thread = use_thread
         self._show_process = None
-        self._data_queue = None
+        self._queue = None
+        self._shared_data = None
+        self._shared_samples = None
+        self._retired_data = []
+        self._data_announced = False
+        self._published = False
+
+        # data handling of the function animation (which receives the buffers via the queue)
+        self._data_reader = None
+        self._samples_reader = None
+        self._stopped = False
+
+    def __getstate__(self):
+        # only the configuration is transferred to the subprocess, neither process nor matplotlib state
+        state = self.__dict__.copy()
+        state.update(
+            _show_process=None, _pending=None, _pending_timer=None, _put_lock=None,
+            _queue=None, _shared_data=None, _shared_samples=None, _retired_data=[],
+            _data_reader=None, _samples_reader=None, _history=None, _new_data=None, _frame=None,
+            fig=None, ax=None, _lines=[], _artists=[], _fps_text=None, _ax_calls=None, _func_animation=None,
+        )
+        return state
 
     def __enter__(self):
         self.start()
@@ -134,30 +624,91 @@ class DataMonitor(object):
 
     def __exit__(self, exc_type, exc_val, exc_tb):
 
+        if exc_type is not None:
+            self.close()
+            return
+
+        # wait until the matplotlib figure is closed
         if self._show_process is not None:
-            if exc_type is not None:
-                try:
-                    self._show_process.terminate()
-                except:
-                    pass
+            self._flush_pending()
+
+            if self.use_thread or not self._published:
+                # stops the rendering of a thread (the function animation might still wait for the first data)
+                self._queue.put(('stop', ))
 
             self._show_process.join()
             self._show_process = None
 
-        if self._data_queue is not None:
-            while not self._data_queue.empty():
-                try:
-                    self._data_queue.get(timeout=0.001)
-                except (TimeoutError, Empty):
-                    pass
+        self._release()
 
-            self._data_queue.close()
-            self._data_queue = None
+    def close(self):
+        """ Terminates a potentially running matplotlib FuncAnimation subprocess and releases the data handling
+
+            A background thread (see `use_thread`) can not be terminated,
+            in this case the method stops the rendering and waits until the final frame has been rendered.
+        """
+        if self._show_process is not None:
+            self._flush_pending()
+
+            if self.use_thread:
+                self._queue.put(('stop', ))
+                self._show_process.join()
+
+            else:
+                self._show_process.terminate()
+                self._show_process.join(timeout=1.)
+
+                if self._show_process.is_alive():
+                    self._show_process.kill()
+                    self._show_process.join()
+
+            self._show_process = None
+
+        self._release()
+
+    def _release(self):
+        """ Releases the data handling of a finished matplotlib FuncAnimation """
+        for shared_data in [*self._retired_data, self._shared_data]:
+            if shared_data is not None:
+                shared_data.close()
+
+        self._shared_data = None
+        self._retired_data = []
+        self._data_announced = False
+        self._published = False
+
+        if self._shared_samples is not None:
+            self._shared_samples.close()
+            self._shared_samples = None
+
+        if self._queue is not None and not self.use_thread:
+            self._queue.cancel_join_thread()  # the function animation has stopped, pending messages are discarded
+            self._queue.close()
+
+        self._queue = None
 
     def start(self):
-        """ Starts the matplotlib FuncAnimation as subprocess (non-blocking, queue communication) """
-        self._data_queue = Queue()
-        self._show_process = Process(name='animate', target=self.show, args=(self._data_queue, ))
+        """ Starts the matplotlib FuncAnimation as subprocess (non-blocking, shared memory communication)
+            or as background thread if `use_thread` is True (non-blocking, in-process communication)
+        """
+        if self.use_thread:
+            backend = matplotlib.get_backend()
+            if is_interactive_backend(backend):
+                raise RuntimeError(f"The interactive matplotlib backend '{backend}' requires to run in the main "
+                                   f"thread, use a non-interactive backend (e.g. 'Agg') or `use_thread=False`.")
+
+            self._queue = SimpleQueue()
+            self._shared_data = LocalBuffer()
+            self._show_process = Thread(name='animate', target=self.show,
+                                        args=(self._queue, self._shared_data), daemon=True)
+            self._show_process.start()
+            return
+
+        # the shared memory buffers are allocated with the first data, and are then passed via the queue
+        # (the subprocess shares the resource tracker of this process, which unlinks leaked shared memory)
+        resource_tracker.ensure_running()
+        self._queue = Queue()
+        self._show_process = Process(name='animate', target=self.show, args=(self._queue, ))
         self._show_process.start()
 
     def stop(self):
@@ -165,64 +716,428 @@ class DataMonitor(object):
         if self._show_process is not None:
             self.__exit__(None, None, None)
 
-    def show(self, data_queue: Connection):
-        """ Creates the matplotlib FuncAnimation and creates the plot (blocking) """
-        self._data_queue = data_queue
-        self.fig, self.ax = self.make_fig(**self.make_fig_kwargs)
+    def show(self, queue: (Queue, SimpleQueue), shared_data: LocalBuffer = None):
+        """ Creates the matplotlib FuncAnimation and creates the plot (blocking)
 
-        self._func_animation = FuncAnimation(
-            self.fig,                   # figure to animate
-            self.animate,               # function to run the animation
-            interval=self.update_rate,  # interval to run the function in millisecond
-        )
+            All matplotlib state is generated here (i.e., in the subprocess),
+            matplotlib.pyplot is not imported by the parent process.
 
-        self.apply_plt_kwargs()
-        plt.tight_layout()
-        plt.show()
+        :param queue: queue of the shared memory buffers (which are allocated with the first data)
+                      and of the data which can not be passed via shared memory
+        :param shared_data: buffer of the data updates of a DataMonitor running in a thread
+        """
+        self._queue = queue
+        self._data_reader = shared_data
+        self._stopped = False
+
+        # without initial data or channels, the number of plotted channels is given by the first data
+        data = self._data
+        while data is None and self.channels is None:
+            data = self.data
+            if self._stopped:
+                return
+
+            if data is None:
+                time.sleep(self.update_rate * 1e-3)
+
+        self._data = data
+
+        if self.backend is not None and not self.use_thread:
+            use_backend(self.backend)
+
+        import matplotlib.pyplot as plt
+        from matplotlib.animation import FuncAnimation
+
+        # a thread must not change the global matplotlib state of the current process:
+        # the rcParams and the style are only applied while the figure is generated
+        with matplotlib.rc_context() if self.use_thread else nullcontext():
+            matplotlib.rcParams.update(RC_PARAMS)
+
+            if self.style is not None:
+                plt.style.use(self.style)
+
+            self.fig, self.ax = self.make_fig(**self.make_fig_kwargs)
+            self._ax_calls = None  # resolved for the new axes
+
+            # generate the line artists once, all animation updates only modify their data
+            if data is None:
+                data = [[] for _ in range(len(self.channels) + 1)]
+
+            # appended samples extend the initial data (if it is a float (x, *y) array)
+            elif self._history is None:
+                initial_data = self._as_array(data)
+                if initial_data is not None:
+                    self._reset_history(n_rows=initial_data.shape[0])
+                    self._append_history(initial_data)
+
+            self._data = None
+            self._lines = self.ax_plot(ax=self.ax, data=data, channels=self.channels)
+            self.apply_plt_kwargs()
+            self.legend(ax=self.ax, channels=self.channels)
+
+            # axes with autoscaled limits require re-scaling and a full redraw in each animation update
+            # (x- and y-limits are autoscaled independently, e.g. only the y-limits if the x-limits are fixed)
+            axes = [self.ax] if not hasattr(self.ax, '__iter__') else self.ax
+            self._autoscale_axes = [(ax, ax.get_autoscalex_on(), ax.get_autoscaley_on()) for ax in axes
+                                    if ax.get_autoscalex_on() or ax.get_autoscaley_on()]
+            self._blit = self.blit and not self._autoscale_axes and self._lines is not None and not self.use_thread
+
+            self._artists = list(self._lines or [])
+            if self.show_fps:
+                self._fps_text = self._make_fps_text()
+                self._artists.append(self._fps_text)
+
+            # the animation is only updated (and re-rendered) if new data has been received
+            if not self.use_thread:
+                timer = self.fig.canvas.new_timer(interval=self.update_rate)
+                self._func_animation = FuncAnimation(
+                    self.fig,                   # figure to animate
+                    self.animate,               # function to run the animation
+                    frames=self.frames,         # generator of the new data of each animation update
+                    init_func=self.init_animation,  # function to prepare the (blitted) artists
+                    interval=self.update_rate,  # interval to poll for new data in millisecond
+                    event_source=DataEventSource(timer, poll=self._poll_data),
+                    blit=self._blit,            # only re-render the line artists
+                    cache_frame_data=False,     # the frames are not replayed
+                )
+
+            self.fig.tight_layout()
+
+        if self.use_thread:
+            self._render_frames()  # the event loop of a GUI backend can not run outside of the main thread
+
+        else:
+            plt.show()
+
+        # release the figure from pyplot's figure management (e.g. for non-interactive backends or threads)
+        plt.close(self.fig)
+        self._close_data_reader()
+        self._samples_reader = None
+        self._history = None
+        self._func_animation = None
+        self._lines = []
+        self._artists = []
+        self._fps_text = None
+        self._last_frame = None
+        self._ax_calls = None
+        self.fig, self.ax = None, None
 
     @property
     def data(self):
-        """ Data property (getter) which tries to read from a
-            multiprocessing queue and returns the current data array
-            on default.
+        """ Data property (getter) which reads the most recent data array
+            from the shared memory (or local) buffer or from the queue, or the accumulated data
+            if samples have been appended in the meantime
+            (or None if no new data has been received).
+
+            All samples appended since the previous call are accumulated at once,
+            such that the line artists are updated only once per animation frame.
         """
-        try:
-            if self._data is not None:
-                data = self._data
-                self._data = None
+        if self._data is not None:
+            data = self._data
+            self._data = None
+            return data
 
-            else:
-                data = self._data_queue.get(timeout=self.update_rate)
+        data = self._receive()
 
-        except (TimeoutError, Empty):
-            data = None
+        if self._data_reader is not None:
+            shared_data = self._data_reader.get()
+            if shared_data is not None:
+                data = shared_data
+
+        if self._samples_reader is not None:
+            samples = self._samples_reader.get()
+            if samples is not None:
+                data = self._append_history(samples)
 
         return data
 
+    def _receive(self):
+        """ Processes the pending messages of the queue (in the order in which they have been sent)
+
+            The messages either announce a newly allocated shared memory buffer (the data
+            published before the announcement is outdated), or carry data which can not be
+            passed via shared memory (which replaces the data of the current shared memory buffer).
+
+        :return: the most recent data received via the queue (or None)
+        """
+        data = None
+        while True:
+            try:
+                kind, *message = self._queue.get_nowait()
+            except Empty:
+                return data
+
+            if kind == 'samples':
+                self._samples_reader, = message
+                if self._history is None or self._history.shape[0] != self._samples_reader.shape[1]:
+                    self._reset_history(n_rows=self._samples_reader.shape[1])
+
+            elif kind == 'buffer':
+                self._close_data_reader()
+                shared_data, seq = message
+                shared_data.mark_read(seq)  # only read the data published after the announcement
+                self._data_reader = shared_data
+
+            elif kind == 'data':
+                self._close_data_reader()
+                data, = message
+
+            elif kind == 'stop':
+                self._stopped = True
+
+    def _close_data_reader(self):
+        """ Detaches the shared memory buffer of the data updates (a local buffer is kept) """
+        if isinstance(self._data_reader, SharedDoubleBuffer):
+            self._data_reader.close()
+            self._data_reader = None
+
     @data.setter
     def data(self, value):
-        """ Puts data to the multiprocessing data queue
+        """ Copies data to the shared memory buffer (or passes it to the local buffer)
             which is then received by the function animation.
+
+            The data monitor is lossy by design: data updates exceeding the `max_fps` rate are dropped
+            (the most recent one is passed once the interval has passed) and,
+            if the function animation can not keep up with the data updates,
+            outdated data is overwritten by the new data.
+        """
+        if self.max_fps is None:
+            self._publish(value)
+            return
+
+        self._check_running()
+
+        with self._put_lock:
+            wait = self._last_put + 1. / self.max_fps - time.monotonic()
+            if wait > 0:
+                self._pending = (value, )
+                if self._pending_timer is None:
+                    self._pending_timer = Timer(wait, self._flush_pending)
+                    self._pending_timer.daemon = True
+                    self._pending_timer.start()
+
+                return
+
+            self._pending = None
+            self._last_put = time.monotonic()
+            self._publish(value)
+
+    def _flush_pending(self):
+        """ Publishes the most recent rate limited data update (if any) """
+        with self._put_lock:
+            if self._pending_timer is not None:
+                self._pending_timer.cancel()
+                self._pending_timer = None
+
+            if self._pending is not None:
+                value, = self._pending
+                self._pending = None
+                self._last_put = time.monotonic()
+                self._publish(value)
+
+    def _publish(self, value):
+        """ Copies float (rows, n) data arrays to the shared memory buffer (which is allocated with the first
+            data of each shape and announced via the queue), any other data is passed via the queue.
         """
-        self._data_queue.put(value)
+        self._check_running()
+        self._published = True
 
-    def animate(self, i):
-        """ The update method of the matplotlib function animation """
-        data = self.data
+        if self.use_thread:
+            self._shared_data.put(value)
+            return
 
+        data = self._as_array(value)
         if data is None:
+            self._queue.put(('data', value))
+            self._data_announced = False
             return
 
-        if self.clear_axes:
-            if hasattr(self.ax, '__iter__'):
-                [ax.cla() for ax in self.ax]  # clear axes
-            else:
-                self.ax.cla()
+        if self._shared_data is None or self._shared_data.shape[0] != data.shape[0]:
+            if self._shared_data is not None:
+                self._retired_data.append(self._shared_data)  # might not yet be attached by the function animation
+
+            self._shared_data = SharedDoubleBuffer(n_rows=data.shape[0], capacity=self.max_points)
+            self._data_announced = False
+
+        if not self._data_announced:
+            self._queue.put(('buffer', self._shared_data, self._shared_data.seq))
+            self._data_announced = True
+
+        self._shared_data.put(data)
+
+    def _check_running(self):
+        """ Raises a RuntimeError if the function animation has not been started (or has been closed) """
+        if self._queue is None:
+            raise RuntimeError('The DataMonitor is not running, call `start` (or use the with environment) first.')
+
+    @staticmethod
+    def _as_array(value):
+        """ Returns the data as float64 array of shape (rows, n), or None if the data can not be converted """
+        try:
+            data = asarray(value, dtype=float64)
+        except (TypeError, ValueError):
+            return None
+
+        return data if ndim(data) == 2 else None
+
+    def append(self, sample):
+        """ Copies a single data sample of the form (x, *y) to the shared memory ring buffer
+            which is then appended to the accumulated data of the function animation.
+
+            The ring buffer is allocated with the number of rows of the first sample,
+            all further samples must have the same number of rows.
+        """
+        self._check_running()
+
+        if self._shared_samples is None:
+            self._shared_samples = SharedRingBuffer(n_rows=len(sample), capacity=self.max_points)
+            self._queue.put(('samples', self._shared_samples))
+            self._published = True
+
+        self._shared_samples.put(sample)
+
+    def _reset_history(self, n_rows: int):
+        """ Allocates the buffer of the accumulated data (with room to append before shifting) """
+        self._history = empty((n_rows, 2 * self.max_points), dtype=float64)
+        self._n_history = 0
+
+    def _append_history(self, samples: ndarray):
+        """ Appends the (x, *y) samples to the accumulated data buffer
+
+        :return: view of the (at most `max_points`) most recent accumulated data points
+        """
+        k = min(samples.shape[1], self.max_points)
+
+        if self._n_history + k > self._history.shape[1]:
+            # shift the data points which are still displayed to the front of the buffer
+            keep = min(self._n_history, self.max_points - k)
+            self._history[:, :keep] = self._history[:, self._n_history - keep:self._n_history]
+            self._n_history = keep
+
+        self._history[:, self._n_history:self._n_history + k] = samples[:, samples.shape[1] - k:]
+        self._n_history += k
+
+        return self._history[:, max(0, self._n_history - self.max_points):self._n_history]
+
+    def _render_frames(self):
+        """ Renders the frames of a DataMonitor thread on the (non-interactive) figure canvas (blocking)
+
+            Each frame with new data is drawn (and stored as RGBA image, see `frame`), until the DataMonitor
+            is exited or closed (the data received until then is rendered in a final frame).
+        """
+        data = None
+        while True:
+            if data is not None:
+                self.animate(data)
+
+            self.fig.canvas.draw()
+            if hasattr(self.fig.canvas, 'buffer_rgba'):  # Agg based canvas
+                self._frame = asarray(self.fig.canvas.buffer_rgba()).copy()
+
+            while True:
+                data = self.data
+                if data is not None or self._stopped:
+                    break
+
+                time.sleep(self.update_rate * 1e-3)
+
+            if data is None:
+                return
+
+    @property
+    def frame(self):
+        """ Most recently rendered frame of a DataMonitor thread, as RGBA image array of shape (height, width, 4)
+            (or None if no frame has been rendered, see `use_thread`)
+        """
+        return self._frame
+
+    def _poll_data(self):
+        """ Reads the data (non-blocking, see `data`) and returns True if new data has been received """
+        self._new_data = self.data
+        return self._new_data is not None
+
+    def frames(self):
+        """ Generator of the matplotlib function animation frames
+
+            Yields the new data of each animation update, which has been received by the preceding poll
+            of the event source (see `DataEventSource`), i.e., animation updates without new data are skipped.
+        """
+        while True:
+            data, self._new_data = self._new_data, None
+            yield data
+
+    def init_animation(self):
+        """ The init method of the matplotlib function animation
+
+        Marks the line artists (and the frame rate display) as animated if the animation is blitted,
+        such that the static background (axes, ticks, legend) is rendered only once.
+
+        :return: list of animated artists (required for blitting)
+        """
+        for artist in self._artists:
+            artist.set_animated(self._blit)
+
+        return self._artists
+
+    def animate(self, data):
+        """ The update method of the matplotlib function animation
+
+        :param data: new data of the animation update (see `frames`), the line artists are not updated if None
+        :return: list of updated artists (required for blitting)
+        """
+        if data is not None and self._lines is None:
+            # `ax_plot` does not return line artists: clear and re-plot the axes
+            self._replot(data)
+
+        elif data is not None:
+            self.ax_update(lines=self._lines, data=data)
+
+            for ax, scalex, scaley in self._autoscale_axes:
+                ax.relim()
+                ax.autoscale_view(scalex=scalex, scaley=scaley)
+
+        self._update_fps()
+
+        return self._artists
+
+    def _replot(self, data):
+        """ Clears (see `clear_axes`) and re-plots the axes with the data of the animation update """
+        if self.clear_axes is not False:
+            axes = [self.ax] if not hasattr(self.ax, '__iter__') else self.ax
+            for ax in axes:
+                ax.cla()  # clear axes
 
         self.ax_plot(ax=self.ax, data=data, channels=self.channels)
         self.apply_plt_kwargs()
         self.legend(ax=self.ax, channels=self.channels)
 
+        if self._fps_text is not None and self.clear_axes is not False:
+            self._fps_text = self._make_fps_text()
+            self._artists = [self._fps_text]
+
+    def _make_fps_text(self):
+        """ Generates the frame rate display in the lower right corner of the (first) axes """
+        ax = self.ax[0] if hasattr(self.ax, '__iter__') else self.ax
+        return ax.text(0.99, 0.01, '', transform=ax.transAxes, ha='right', va='bottom')
+
+    @property
+    def fps(self) -> float:
+        """ Measured frame rate of the running function animation (exponential moving average, 0 before) """
+        return self._fps.value
+
+    def _update_fps(self):
+        """ Updates the measured frame rate (exponential moving average) and its display """
+        now = time.monotonic()
+
+        if self._last_frame is not None and now > self._last_frame:
+            fps = 1. / (now - self._last_frame)
+            self._fps.value = fps if not self._fps.value else 0.9 * self._fps.value + 0.1 * fps
+
+            if self._fps_text is not None:
+                self._fps_text.set_text(f'{self._fps.value:.1f} fps')
+
+        self._last_frame = now
+
     def apply_plt_kwargs(self):
         """ apply plt_kwargs instructions and shows the legend if labels have been defined in
         the channels information during construction
@@ -235,12 +1150,37 @@ class DataMonitor(object):
        attribute (e.g. ((0, 1), {}) or (('values', ), {}).
         """
 
+        if self._ax_calls is None:
+            self._ax_calls = self._resolve_ax_kwargs()
+
+        for method, args, kwargs in self._ax_calls:
+            method(*args, **kwargs)
+
+    def _resolve_ax_kwargs(self):
+        """ Resolves the `ax_kwargs` instructions of the current axes
+
+        :return: list of (method, args, kwargs) tuples, where method is the
+                 bound axes method (or the `matplotlib.pyplot` function, if the axes have no
+                 corresponding method) of each instruction
+        """
+
+        import matplotlib.pyplot as plt
+
         axes = [self.ax] if not hasattr(self.ax, '__iter__') else self.ax
         plt_kwargs = [self.ax_kwargs]*len(axes) if isinstance(self.ax_kwargs, dict) else self.ax_kwargs
 
+        ax_calls = []
         for ax, ax_kwargs in zip(axes, plt_kwargs):
             for attribute, (args, kwargs) in ax_kwargs.items():
-                try:
-                    getattr(ax, attribute)(*args, **kwargs)
-                except AttributeError:
-                    getattr(plt, attribute)(*args, **kwargs)
+                # pyplot-style attributes (e.g. 'xlim' or 'title') are mapped to the axes setters
+                # (e.g. 'set_xlim' or 'set_title', rather than to the non-callable `Axes.title` text artist)
+                method = getattr(ax, 'set_' + attribute, None)
+                if not callable(method):
+                    method = getattr(ax, attribute, None)
+
+                if not callable(method):
+                    method = getattr(plt, attribute)
+
+                ax_calls.append((method, args, kwargs))
+
+        return ax_calls
@@ -1,18 +1,27 @@
+import math
+import random
 import time
 import numpy as np
 from itertools import count
 from data_monitor import DataMonitor
 
 
-def get_sample(index):
-    """ generate sample data based on a itertools.count() instance """
+OMEGA = math.pi * 2. / 30.
+""" angular frequency (per step) of the sample data """
+
+
+def get_sample(index, _cos=math.cos, _sin=math.sin, _rnd=random.random):
+    """ generate sample data based on a itertools.count() instance
+        (scalar `math` and `random` functions avoid the numpy overhead for single floats,
+        they are bound as default arguments for a fast local lookup)
+    """
 
     t = next(index)
 
     data = [
         t,
-        np.cos(t * np.pi * 2. / 30.) + 1 + np.random.rand() * 0.25 - 0.125,
-        np.sin(t * np.pi * 2. / 30.) - 1 + np.random.rand() * 0.25 - 0.125,
+        _cos(t * OMEGA) + 1 + _rnd() * 0.25 - 0.125,
+        _sin(t * OMEGA) - 1 + _rnd() * 0.25 - 0.125,
     ]
 
     return data
@@ -28,10 +37,6 @@ def data_monitor(n_steps: int = 150, sleep_time: float = 0.01):
     # generate itertools.count instance
     index = count()
 
-    # get temporal data
-    sample = get_sample(index=index)
-    data = [sample]
-
     # define meta-info for DataMonitor plotting (label of data-rows and coloring)
     channels = [
         {'label': 'Channel 1'},
@@ -51,14 +56,13 @@ def data_monitor(n_steps: int = 150, sleep_time: float = 0.01):
     #   `with` takes care of this
     with DataMonitor(channels=channels, ax_kwargs=plt_kwargs) as dm:
 
-        for i in range(1, n_steps):
+        for i in range(n_steps):
 
             # pull next sample data
             sample = get_sample(index)
-            data.append(sample)
 
-            # update the data-monitor (row-wise data: (x, y1, y2))
-            dm.data = np.asarray(data).T
+            # append the sample to the data-monitor (sample data: (x, y1, y2))
+            dm.append(sample)
 
             # apply delay
             time.sleep(sleep_time)
@@ -73,19 +77,13 @@ def nonblocking_plot(n_steps: int = 150, sleep_time: float = 0.01):
     :param sleep_time:  delay time between data-poin generation
     """
 
-    # generate itertools.count instance
-    index = count()
-
-    # get ALL temporal data
-    sample = get_sample(index=index)
-    data = [sample]
-
-    for i in range(1, n_steps):
-        # pull next sample data
-        sample = get_sample(index)
-        data.append(sample)
-
-    data = np.asarray(data).T
+    # get ALL temporal data at once (vectorized version of `get_sample`)
+    t = np.arange(n_steps, dtype=np.float64)
+    data = np.stack([
+        t,
+        np.cos(t * OMEGA) + 1 + np.random.rand(n_steps) * 0.25 - 0.125,
+        np.sin(t * OMEGA) - 1 + np.random.rand(n_steps) * 0.25 - 0.125,
+    ])
 
     # define meta-info for DataMonitor plotting (label of data-rows and coloring)
     channels = [
@@ -126,22 +124,24 @@ def custom_axes_monitor(n_steps: int = 150, sleep_time: float = 0.01):
         fig, (ax_0, ax_1) = plt.subplots(2, 1, sharex=True, **kwargs)
         return fig, (ax_0, ax_1)
 
-    # define, how data (x, y1, x2) is plotted on axes
+    # define, how data (x, y1, x2) is plotted on axes (the generated line artists are updated in the animation)
     def axes_plot(ax, data, channels):
         x, y1, y2 = data
 
-        ax[0].plot(x, y1, **channels[0])
-        ax[1].plot(x, y2, **channels[1])
+        line_1, = ax[0].plot(x, y1, **channels[0])
+        line_2, = ax[1].plot(x, y2, **channels[1])
+
+        return [line_1, line_2]
 
     # show legend in each subplot
     def legend(ax, channels):
         for ax_i in ax:
             ax_i.legend()
 
-    # generate data
+    # generate data (preallocated row-wise data: (x, y1, y2))
     index = count()
-    sample = get_sample(index)
-    data = [sample]
+    data = np.empty((3, n_steps), dtype=np.float64)
+    data[:, 0] = get_sample(index)
 
     # define channel meta-info
     channels = [
@@ -169,11 +169,10 @@ def custom_axes_monitor(n_steps: int = 150, sleep_time: float = 0.01):
 
         for i in range(1, n_steps):
             # pull next sample data
-            sample = get_sample(index)
-            data.append(sample)
+            data[:, i] = get_sample(index)
 
-            # update the data-monitor (row-wise data: (x, y1, y2))
-            dm.data = np.asarray(data).T
+            # update the data-monitor with the data generated so far
+            dm.data = data[:, :i + 1]
 
             # apply delay
             time.sleep(sleep_time)
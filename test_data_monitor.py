@@ -0,0 +1,326 @@
+import matplotlib
+import pickle
+import pytest
+import time
+from queue import Empty
+from threading import Thread
+from numpy import arange, array, concatenate, stack
+from numpy.testing import assert_array_equal
+from data_monitor import DataEventSource, DataMonitor, LocalBuffer, SharedDoubleBuffer, SharedRingBuffer
+from data_monitor import default_ax_plot, default_ax_update, default_fig
+
+
+matplotlib.use('Agg')
+
+
+class ProducingCounter(object):
+    """ Shared counter of a consumer which runs `produce` before the `on_read`-th read of the counter,
+        to deterministically simulate a producer writing while the consumer copies the data
+    """
+
+    def __init__(self, counter, produce, on_read=2):
+        self.counter = counter
+        self.produce = produce
+        self.on_read = on_read
+        self.reads = 0
+
+    def __getitem__(self, index):
+        self.reads += 1
+        if self.reads == self.on_read:
+            self.produce()
+
+        return self.counter[index]
+
+
+def attach(buffer):
+    """ Attaches a consumer to the shared memory of the buffer (as done by the DataMonitor subprocess) """
+    return pickle.loads(pickle.dumps(buffer))
+
+
+def sample(i):
+    return [i, 10 * i]
+
+
+def samples(*indices):
+    return array([sample(i) for i in indices], dtype=float).T
+
+
+@pytest.fixture
+def ring():
+    producer = SharedRingBuffer(n_rows=2, capacity=4)
+    consumer = attach(producer)
+    yield producer, consumer
+    consumer.close()
+    producer.close()
+
+
+@pytest.fixture
+def double_buffer():
+    producer = SharedDoubleBuffer(n_rows=2, capacity=4)
+    consumer = attach(producer)
+    yield producer, consumer
+    consumer.close()
+    producer.close()
+
+
+def test_ring_wrap_around(ring):
+    producer, consumer = ring
+    assert consumer.get() is None
+
+    for i in range(3):
+        producer.put(sample(i))
+
+    assert_array_equal(consumer.get(), samples(0, 1, 2))
+    assert consumer.get() is None
+
+    # the pending samples wrap around the end of the ring
+    for i in range(3, 6):
+        producer.put(sample(i))
+
+    assert_array_equal(consumer.get(), samples(3, 4, 5))
+
+
+def test_ring_overrun(ring):
+    producer, consumer = ring
+
+    for i in range(10):
+        producer.put(sample(i))
+
+    # of the `capacity` most recent samples, the slot which is written next is considered torn
+    assert_array_equal(consumer.get(), samples(7, 8, 9))
+
+
+def test_ring_overwrite_during_copy(ring):
+    producer, consumer = ring
+
+    for i in range(3):
+        producer.put(sample(i))
+
+    # the producer writes two samples while the consumer copies, overwriting the slot of sample 0
+    # (and possibly currently writing the slot of sample 1)
+    consumer._head = ProducingCounter(consumer._head, lambda: [producer.put(sample(i)) for i in (3, 4)])
+    assert_array_equal(consumer.get(), samples(2))
+    assert_array_equal(consumer.get(), samples(3, 4))
+
+
+def test_double_buffer_latest(double_buffer):
+    producer, consumer = double_buffer
+    assert consumer.get() is None
+
+    producer.put(stack([arange(3.), arange(3.)]))
+    producer.put(stack([arange(6.), 2 * arange(6.)]))
+
+    # only the most recent data is read, truncated to its `capacity` most recent data points
+    assert_array_equal(consumer.get(), stack([arange(2., 6.), 2 * arange(2., 6.)]))
+    assert consumer.get() is None
+
+
+def test_double_buffer_shape(double_buffer):
+    producer, _ = double_buffer
+
+    with pytest.raises(ValueError):
+        producer.put(arange(3.))
+
+    with pytest.raises(ValueError):
+        producer.put(stack([arange(3.)] * 3))
+
+
+def test_double_buffer_retry(double_buffer):
+    producer, consumer = double_buffer
+    producer.put(stack([arange(3.), arange(3.)]))
+
+    # the producer publishes twice while the consumer copies, overwriting the copied buffer
+    newest = stack([arange(4.), 3 * arange(4.)])
+    consumer._seq = ProducingCounter(consumer._seq, lambda: [producer.put(newest - 1), producer.put(newest)])
+
+    assert_array_equal(consumer.get(), newest)
+    assert consumer._seq.reads == 3  # a single retry
+    assert consumer.get() is None
+
+
+class Timer(object):
+    """ Figure canvas timer, which is fired explicitly """
+
+    def __init__(self):
+        self.interval = 1
+        self.callbacks = []
+
+    def add_callback(self, func):
+        self.callbacks.append(func)
+
+    def fire(self):
+        for func in self.callbacks:
+            func()
+
+
+def test_data_event_source():
+    polls = iter([False, True, False, False, True])
+    steps = []
+
+    timer = Timer()
+    source = DataEventSource(timer, poll=lambda: next(polls))
+    source.add_callback(steps.append, 'step')
+
+    for _ in range(5):
+        timer.fire()
+
+    # the animation is only stepped for the polls with new data
+    assert steps == ['step', 'step']
+
+    source.remove_callback(steps.append)
+    source.interval = 10
+    assert source.callbacks == [] and timer.interval == 10
+
+
+def red_pixels(frame):
+    return (frame[..., 0] > 200) & (frame[..., 1] < 100) & (frame[..., 2] < 100)
+
+
+def test_thread_renders_frames():
+    with DataMonitor(channels=[{'color': 'red'}], use_thread=True, make_fig_kwargs=dict(figsize=(2, 1), dpi=50),
+                     ax_kwargs=dict(xlim=((0, 10), {}), ylim=((0, 10), {}))) as dm:
+
+        # the initial (empty) frame is rendered as soon as the figure has been generated
+        while dm.frame is None:
+            time.sleep(0.01)
+
+        assert not red_pixels(dm.frame).any()
+
+        for i in range(10):
+            dm.append([i, 5])
+
+    # the final frame (with all appended samples) shows the horizontal red line
+    assert dm.frame.shape == (50, 100, 4)
+    assert red_pixels(dm.frame).any()
+
+
+class PicklingQueue(object):
+    """ In-process queue which pickles the messages (as the multiprocessing queue of a DataMonitor subprocess) """
+
+    def __init__(self):
+        self.messages = []
+
+    def put(self, message):
+        self.messages.append(pickle.dumps(message))
+
+    def get_nowait(self):
+        if not self.messages:
+            raise Empty
+
+        return pickle.loads(self.messages.pop(0))
+
+
+@pytest.fixture
+def monitor():
+    """ DataMonitor which receives its own data (producer and function animation in the current process) """
+    dm = DataMonitor()
+    dm._queue = PicklingQueue()
+    yield dm
+    dm._close_data_reader()
+    dm._queue = None
+    dm._release()
+
+
+def test_receive(monitor):
+    monitor.data = [[0, 1], [1, 2]]
+    assert_array_equal(monitor.data, [[0, 1], [1, 2]])
+    assert monitor.data is None
+
+    # data which is not a float (rows, n) array is passed via the queue
+    monitor.data = [[0, 1], [1]]
+    assert monitor.data == [[0, 1], [1]]
+
+    # a changed number of rows allocates a new shared memory buffer
+    monitor.data = [[0], [1], [2]]
+    assert_array_equal(monitor.data, [[0], [1], [2]])
+
+
+def test_receive_order(monitor):
+    monitor.data = [[0, 1], [1, 2]]
+    monitor.data = [[0, 1], [1]]
+    assert monitor.data == [[0, 1], [1]]
+
+    # the data of the announced buffer is newer than the data passed via the queue before
+    monitor.data = [[0, 1], [1]]
+    monitor.data = [[0, 1], [2, 3]]
+    assert_array_equal(monitor.data, [[0, 1], [2, 3]])
+
+
+def test_max_fps(monitor):
+    monitor.max_fps = 20.
+    for i in range(10):
+        monitor.data = [[i], [i]]
+
+    assert_array_equal(monitor.data, [[0], [0]])
+    assert monitor.data is None
+
+    # the last data update of the burst is published once the interval has passed
+    time.sleep(2. / monitor.max_fps)
+    assert_array_equal(monitor.data, [[9], [9]])
+
+
+def test_max_fps_exit():
+    dm = DataMonitor(max_fps=1., use_thread=True)
+    dm._queue = PicklingQueue()
+    published = []
+    dm._publish = published.append
+
+    dm.data = 0
+    dm.data = 1
+    assert published == [0]
+
+    # the pending data update is published on exit (before waiting for the thread)
+    dm._show_process = Thread(target=lambda: None)
+    dm._show_process.start()
+    dm.__exit__(None, None, None)
+    assert published == [0, 1]
+
+
+def test_not_running():
+    dm = DataMonitor()
+
+    with pytest.raises(RuntimeError):
+        dm.append([0, 1])
+
+    with pytest.raises(RuntimeError):
+        dm.data = [[0], [1]]
+
+
+def test_append_history():
+    dm = DataMonitor(max_points=3)
+    dm._reset_history(n_rows=2)
+
+    appended = []
+    for k in (1, 2, 1, 3, 5, 2, 1):
+        chunk = stack([arange(len(appended), len(appended) + k), -arange(k)])
+        appended.extend(chunk.T)
+        history = dm._append_history(chunk)
+
+        # the history holds the (at most) `max_points` most recent samples across the shifts of the buffer
+        assert_array_equal(history, array(appended[-3:]).T)
+
+    assert dm._history.shape == (2, 6)
+
+
+def test_ax_update_keeps_newest_point():
+    fig, ax = default_fig(figsize=(1, 1), dpi=10)
+    x = arange(100.)
+    lines = default_ax_plot(ax, [x, x, -x])
+
+    # 10 pixels at 4 points per pixel: stride 2 for an odd number of data points
+    for n in (99, 100, 37):
+        default_ax_update(lines, [x[:n], x[:n], -x[:n]])
+
+        for line in lines:
+            assert line.get_xdata()[-1] == n - 1
+            assert len(line.get_xdata()) == len(line.get_ydata())
+
+
+def test_resolve_ax_kwargs():
+    dm = DataMonitor(ax_kwargs=dict(xlim=((0, 1), {}), title=(('T', ), {}), set_ylabel=(('y', ), {})))
+    dm.fig, dm.ax = default_fig()
+
+    assert [method.__name__ for method, _, _ in dm._resolve_ax_kwargs()] == ['set_xlim', 'set_title', 'set_ylabel']
+
+    dm.apply_plt_kwargs()
+    assert dm.ax.get_title() == 'T' and dm.ax.get_xlim() == (0, 1)